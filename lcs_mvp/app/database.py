@@ -483,6 +483,8 @@ def init_db_path(db_path: str) -> None:
             );
 
             CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+            -- Seed scripts check for their corpus marker by change_note.
+            CREATE INDEX IF NOT EXISTS idx_tasks_change_note ON tasks(change_note);
             CREATE INDEX IF NOT EXISTS idx_workflows_status ON workflows(status);
             CREATE INDEX IF NOT EXISTS idx_primers_status ON primers(status);
 
@@ -0,0 +1,101 @@
+"""Helpers shared by the seed scripts (this module seeds nothing itself).
+
+The scripts run as ``python3 seed/<script>.py``, which puts this directory on
+sys.path, so they import these as ``from seed_common import ...``.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from json import dumps as _json_dumps
+from uuid import UUID
+
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _orjson_dumps = None
+
+
+# Seeded tasks carry no assets; bind the serialized empty list directly.
+EMPTY_JSON_LIST = "[]"
+
+# Lowest SQLITE_MAX_VARIABLE_NUMBER across supported SQLite builds.
+_MAX_SQL_VARS = 999
+
+
+# j() encodes the JSON columns with orjson when it is installed, else stdlib json;
+# both paths write the same bytes.
+if _orjson_dumps is not None:
+    def j(v) -> str:
+        # orjson always emits UTF-8 (no ASCII escaping), matching ensure_ascii=False.
+        return _orjson_dumps(v).decode("utf-8")
+else:
+    def j(v) -> str:
+        # Compact separators: same bytes as orjson, and smaller rows.
+        return _json_dumps(v, ensure_ascii=False, separators=(",", ":"))
+
+
+def gen_uuids(n: int) -> list[str]:
+    """Return n random (version 4) UUID strings drawn from a single urandom read."""
+    raw = os.urandom(16 * n)
+    return [str(UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def insert_multirow(cur: sqlite3.Cursor | sqlite3.Connection, insert_head: str, rows: list[tuple]) -> None:
+    """Insert rows with multi-row ``VALUES (...),(...)`` statements.
+
+    insert_head is the ``INSERT INTO table(cols...)`` part. Rows are chunked so each
+    statement stays under SQLite's conservative 999 bound-parameter limit.
+    """
+    if not rows:
+        return
+    width = len(rows[0])
+    group = "(" + ",".join("?" * width) + ")"
+    per_stmt = max(1, _MAX_SQL_VARS // width)
+    for i in range(0, len(rows), per_stmt):
+        chunk = rows[i:i + per_stmt]
+        cur.execute(
+            f"{insert_head} VALUES {','.join([group] * len(chunk))}",
+            [x for row in chunk for x in row],
+        )
+
+
+def defer_secondary_indexes(cur: sqlite3.Cursor, tables: tuple[str, ...]) -> list[tuple[str, str]]:
+    """Drop the secondary (non-unique) indexes on tables; return their (name, sql).
+
+    Run inside the load transaction and pass the result to restore_indexes() once the
+    rows are in. DDL is transactional, so an aborted seed keeps the indexes.
+    """
+    marks = ",".join("?" * len(tables))
+    deferred = [
+        (name, sql)
+        for name, sql in cur.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name IN ({marks}) "
+            "AND sql LIKE 'CREATE INDEX%'",
+            tables,
+        ).fetchall()
+    ]
+    for name, _ in deferred:
+        cur.execute(f'DROP INDEX "{name}"')
+    return deferred
+
+
+def restore_indexes(cur: sqlite3.Cursor, deferred: list[tuple[str, str]]) -> None:
+    """Recreate indexes dropped by defer_secondary_indexes()."""
+    for _, sql in deferred:
+        cur.execute(sql)
+
+
+def check_foreign_keys(cur: sqlite3.Cursor | sqlite3.Connection, table: str | None = None) -> None:
+    """Exit with an error if table (or, by default, any table) has FK violations.
+
+    Seeds load with foreign_keys off (their refs point at rows inserted earlier in
+    the same transaction, so per-row FK probes are wasted work) and validate once with
+    this instead. foreign_key_check works regardless of the foreign_keys setting, so
+    call it before COMMIT: a violation exits with the transaction uncommitted.
+    """
+    pragma = f'PRAGMA foreign_key_check("{table}")' if table else "PRAGMA foreign_key_check"
+    violations = cur.execute(pragma).fetchall()
+    if violations:
+        raise SystemExit(f"Seed error: {len(violations)} foreign key violation(s), first: {tuple(violations[0])}")
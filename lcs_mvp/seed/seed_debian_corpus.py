@@ -26,24 +26,65 @@ Notes:
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sqlite3
 import sys
-import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
+from seed_common import EMPTY_JSON_LIST, gen_uuids, j
+
+
+# Performance note: seeding is dominated by SQLite writes, JSON encoding and id
+# generation, all of which already run in C. Compiling this module (Numba/Cython)
+# would not help; keep inserts batched (executemany, one transaction) and JSON
+# encoding in orjson when available.
 
 SEED_NOTE = "seed_debian_corpus_v1"
 ACTOR = "seed"
 
+TASK_REVIEW_NOTE = (
+    "Seeded Debian corpus (demo). Confirmed items represent reviewed examples; unconfirmed require SME review."
+)
+WORKFLOW_REVIEW_NOTE = (
+    "Seeded Debian corpus (demo). Confirmed workflows are reviewed examples; unconfirmed require SME review."
+)
+
+# Insert statements are module constants so every row reuses the same SQL text
+# (and therefore the connection's cached prepared statement).
+INSERT_TASK_SQL = """
+INSERT INTO tasks(
+  record_id, version, status,
+  title, outcome, facts_json, concepts_json, procedure_name, steps_json, dependencies_json,
+  irreversible_flag, task_assets_json,
+  domain,
+  tags_json, meta_json,
+  created_at, updated_at, created_by, updated_by,
+  reviewed_at, reviewed_by, change_note,
+  needs_review_flag, needs_review_note
+) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
 
-def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+INSERT_WORKFLOW_SQL = """
+INSERT INTO workflows(
+  record_id, version, status,
+  title, objective,
+  domains_json,
+  tags_json, meta_json,
+  created_at, updated_at, created_by, updated_by,
+  reviewed_at, reviewed_by, change_note,
+  needs_review_flag, needs_review_note
+) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
 
+INSERT_REF_SQL = """
+INSERT INTO workflow_task_refs(workflow_record_id, workflow_version, order_index, task_record_id, task_version)
+VALUES (?,?,?,?,?)
+"""
 
-def j(v) -> str:
-    return json.dumps(v, ensure_ascii=False)
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
 def _derive_actions(step_text: str) -> list[str]:
@@ -207,7 +248,7 @@ def task(
         # Tags are conceptual labels (discovery/filtering). Domain is stored separately.
         "tags": tags or ["operations"],
         "meta": meta or {"owner_team": "IT Operations", "risk_level": "medium"},
-        "irreversible": irreversible,
+        "irreversible": int(irreversible),
         "domain": domain,
     }
 
@@ -240,6 +281,18 @@ def _normalize_tags(tags: list[str]) -> list[str]:
     return norm
 
 
+def _with_json(t: dict) -> dict:
+    """Normalize tags and cache the task's serialized JSON columns on the dict."""
+    t["tags"] = _normalize_tags(t.get("tags", []) or [])
+    t["facts_json"] = j(t.get("facts", []))
+    t["concepts_json"] = j(t.get("concepts", []))
+    t["steps_json"] = j(t.get("steps", []))
+    t["deps_json"] = j(t.get("deps", []))
+    t["tags_json"] = j(t["tags"])
+    t["meta_json"] = j(t.get("meta", {}))
+    return t
+
+
 def build_tasks() -> list[dict]:
     """Build a Debian/Linux admin task corpus.
 
@@ -594,43 +647,54 @@ def build_tasks() -> list[dict]:
         ("fail2ban", "fail2ban-client"),
     ]
 
-    for pkg, binname in pkg_pairs:
-        tasks.append(
-            task(
-                f"Install and verify package: {pkg}",
-                f"Package '{pkg}' is installed and the '{binname}' command is available.",
-                f"Install {pkg}",
-                [
-                    step(f"Install {pkg} using apt install {pkg}.", "APT reports installation completed successfully."),
-                    step(f"Confirm {pkg} is installed using dpkg -l {pkg}.", "dpkg -l shows the package in installed state."),
-                    step(f"Confirm the binary is callable: run {binname} --version.", "Command returns version output or exits with status 0."),
-                ],
-                deps=["APT metadata is current.", "Sudo access."],
-                facts=["APT installs dependencies automatically."],
-                concepts=["Installing via APT creates traceable, reproducible state."],
-                tags=["linux", "debian", "apt"],
-            )
+    # Fields shared by every templated task are built once, not per iteration.
+    pkg_deps = ["APT metadata is current.", "Sudo access."]
+    pkg_facts = ["APT installs dependencies automatically."]
+    pkg_concepts = ["Installing via APT creates traceable, reproducible state."]
+    pkg_tags = ["linux", "debian", "apt"]
+
+    tasks += [
+        task(
+            f"Install and verify package: {pkg}",
+            f"Package '{pkg}' is installed and the '{binname}' command is available.",
+            f"Install {pkg}",
+            [
+                step(f"Install {pkg} using apt install {pkg}.", "APT reports installation completed successfully."),
+                step(f"Confirm {pkg} is installed using dpkg -l {pkg}.", "dpkg -l shows the package in installed state."),
+                step(f"Confirm the binary is callable: run {binname} --version.", "Command returns version output or exits with status 0."),
+            ],
+            deps=pkg_deps,
+            facts=pkg_facts,
+            concepts=pkg_concepts,
+            tags=pkg_tags,
         )
+        for pkg, binname in pkg_pairs
+    ]
 
     # systemd actions for common services
     svc_units = ["ssh", "cron", "rsyslog", "ufw", "fail2ban"]
-    for unit in svc_units:
-        tasks.append(
-            task(
-                f"Enable and start systemd unit: {unit}",
-                f"The {unit} unit is enabled and running.",
-                f"Enable+start {unit}",
-                [
-                    step(f"Enable {unit} using systemctl enable {unit}.", "systemctl is-enabled reports enabled."),
-                    step(f"Start {unit} using systemctl start {unit}.", "systemctl status shows Active: active (running)."),
-                    step(f"Check recent logs for {unit}.", "journalctl output contains no error-level messages since start."),
-                ],
-                deps=["Unit is installed.", "Sudo access."],
-                facts=["Enablement and runtime state are separate concerns."],
-                concepts=["Service management must be auditable and repeatable."],
-                tags=["linux", "debian", "systemd"],
-            )
+    svc_deps = ["Unit is installed.", "Sudo access."]
+    svc_facts = ["Enablement and runtime state are separate concerns."]
+    svc_concepts = ["Service management must be auditable and repeatable."]
+    svc_tags = ["linux", "debian", "systemd"]
+
+    tasks += [
+        task(
+            f"Enable and start systemd unit: {unit}",
+            f"The {unit} unit is enabled and running.",
+            f"Enable+start {unit}",
+            [
+                step(f"Enable {unit} using systemctl enable {unit}.", "systemctl is-enabled reports enabled."),
+                step(f"Start {unit} using systemctl start {unit}.", "systemctl status shows Active: active (running)."),
+                step(f"Check recent logs for {unit}.", "journalctl output contains no error-level messages since start."),
+            ],
+            deps=svc_deps,
+            facts=svc_facts,
+            concepts=svc_concepts,
+            tags=svc_tags,
         )
+        for unit in svc_units
+    ]
 
     # misc operational tasks
     tasks += [
@@ -838,7 +902,32 @@ def build_tasks() -> list[dict]:
     ]
 
     # Keep corpus size stable for demos (45 Debian + 5 Kubernetes)
-    return (tasks[:45] + k8s)[:50]
+    return [_with_json(t) for t in (tasks[:45] + k8s)[:50]]
+
+
+def task_rows(inserted: list[tuple[str, int, dict]], tail: dict[str, tuple]) -> Iterator[tuple]:
+    """Yield INSERT_TASK_SQL parameters for (record_id, version, task) entries.
+
+    tail maps a status to the shared trailing audit/review columns.
+    """
+    for rid, ver, t in inserted:
+        yield (
+            rid,
+            ver,
+            t["status"],
+            t["title"],
+            t["outcome"],
+            t["facts_json"],
+            t["concepts_json"],
+            t["procedure_name"],
+            t["steps_json"],
+            t["deps_json"],
+            t["irreversible"],
+            EMPTY_JSON_LIST,
+            (t.get("domain") or "linux"),
+            t["tags_json"],
+            t["meta_json"],
+        ) + tail[t["status"]]
 
 
 def build_workflows(task_ids: list[tuple[str, int, dict]]) -> list[dict]:
@@ -858,8 +947,14 @@ def build_workflows(task_ids: list[tuple[str, int, dict]]) -> list[dict]:
         s = substr.lower()
         return pick_where(lambda t: s in (t.get("title", "").lower()), n)
 
+    # One pass over the tasks builds per-tag pools (in task order) for pick_tag.
+    tag_index: dict[str, list[tuple[str, int]]] = {}
+    for rid, ver, t in task_ids:
+        for tag in dict.fromkeys(t.get("tags", []) or []):
+            tag_index.setdefault(tag, []).append((rid, ver))
+
     def pick_tag(tag: str, n: int) -> list[tuple[str, int]]:
-        return pick_where(lambda t: tag in (t.get("tags", []) or []), n)
+        return tag_index.get(tag, [])[:n]
 
     # Primitive pools
     storage = pick_tag("storage", 10)
@@ -1018,20 +1113,28 @@ def main() -> None:
 
     init_db()
 
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.row_factory = sqlite3.Row
+    # Autocommit at the driver level; transactions are opened/closed explicitly below.
+    conn = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
+    # Reuse one cursor rather than the throwaway cursor conn.execute() creates per call.
+    cur = conn.cursor()
+    cur.execute("PRAGMA foreign_keys = ON")
+    # One-shot bulk load: WAL + NORMAL sync avoids an fsync per statement.
+    cur.execute("PRAGMA journal_mode = WAL")
+    cur.execute("PRAGMA synchronous = NORMAL")
+    cur.execute("PRAGMA temp_store = MEMORY")
+    cur.execute("PRAGMA cache_size = -65536")  # 64 MiB
 
     if args.reset_db:
         # Wipe ALL records so the DB contains only this corpus.
         # Order matters due to FK constraints.
-        conn.execute("DELETE FROM workflow_task_refs")
-        conn.execute("DELETE FROM workflows")
-        conn.execute("DELETE FROM tasks")
-        conn.execute("DELETE FROM audit_log")
-        conn.commit()
-
-    existing = conn.execute(
+        cur.execute("BEGIN IMMEDIATE")
+        cur.execute("DELETE FROM workflow_task_refs")
+        cur.execute("DELETE FROM workflows")
+        cur.execute("DELETE FROM tasks")
+        cur.execute("DELETE FROM audit_log")
+        cur.execute("COMMIT")
+
+    existing = cur.execute(
         "SELECT 1 FROM tasks WHERE change_note=? LIMIT 1",
         (SEED_NOTE,),
     ).fetchone()
@@ -1040,159 +1143,108 @@ def main() -> None:
 
     now = utc_now_iso()
 
+    # Review columns by status: (reviewed_at, reviewed_by, needs_review_flag).
+    status_meta = {
+        "confirmed": (now, ACTOR, 0),
+        "submitted": (None, None, 1),
+        "draft": (None, None, 1),
+    }
+    # Trailing audit/review columns are identical for every row of a given status,
+    # so each row is its own head plus one of these prebuilt tails.
+    task_tail = {
+        st: (now, now, ACTOR, ACTOR, reviewed_at, reviewed_by, SEED_NOTE, flag, TASK_REVIEW_NOTE)
+        for st, (reviewed_at, reviewed_by, flag) in status_meta.items()
+    }
+    wf_tail = {
+        st: (now, now, ACTOR, ACTOR, reviewed_at, reviewed_by, SEED_NOTE, flag, WORKFLOW_REVIEW_NOTE)
+        for st, (reviewed_at, reviewed_by, flag) in status_meta.items()
+    }
+
     tasks = build_tasks()
     # 50 tasks: 35 confirmed, 10 submitted, 5 draft
-    for idx, t in enumerate(tasks):
-        if idx < 35:
-            t["status"] = "confirmed"
-        elif idx < 45:
-            t["status"] = "submitted"
-        else:
-            t["status"] = "draft"
-
-    inserted: list[tuple[str, int, dict]] = []
-
-    for t in tasks:
-        rid = str(uuid.uuid4())
-        ver = 1
-        reviewed_at = now if t["status"] == "confirmed" else None
-        reviewed_by = ACTOR if t["status"] == "confirmed" else None
-        needs_review_flag = 0 if t["status"] == "confirmed" else 1
-
-        # Normalize tags to conceptual labels
-        t["tags"] = _normalize_tags(t.get("tags", []) or [])
-
-        conn.execute(
-            """
-            INSERT INTO tasks(
-              record_id, version, status,
-              title, outcome, facts_json, concepts_json, procedure_name, steps_json, dependencies_json,
-              irreversible_flag, task_assets_json,
-              domain,
-              tags_json, meta_json,
-              created_at, updated_at, created_by, updated_by,
-              reviewed_at, reviewed_by, change_note,
-              needs_review_flag, needs_review_note
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                rid,
-                ver,
-                t["status"],
-                t["title"],
-                t["outcome"],
-                j(t.get("facts", [])),
-                j(t.get("concepts", [])),
-                t["procedure_name"],
-                j(t.get("steps", [])),
-                j(t.get("deps", [])),
-                int(t.get("irreversible", 0)),
-                j([]),
-                (t.get("domain") or "linux"),
-                j(t.get("tags", [])),
-                j(t.get("meta", {})),
-                now,
-                now,
-                ACTOR,
-                ACTOR,
-                reviewed_at,
-                reviewed_by,
-                SEED_NOTE,
-                needs_review_flag,
-                "Seeded Debian corpus (demo). Confirmed items represent reviewed examples; unconfirmed require SME review.",
-            ),
-        )
-        inserted.append((rid, ver, t))
-
-    workflows = build_workflows(inserted)
-
-    # Workflows: mostly confirmed to demonstrate strength.
-    # Confirmed workflows must reference confirmed tasks only.
-    for idx, wf in enumerate(workflows):
-        if idx < 8:
+    for t in tasks[:35]:
+        t["status"] = "confirmed"
+    for t in tasks[35:45]:
+        t["status"] = "submitted"
+    for t in tasks[45:]:
+        t["status"] = "draft"
+
+    # All corpus inserts go through a single write transaction; any error (including
+    # SystemExit) rolls it back so no partial corpus is left behind.
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        inserted: list[tuple[str, int, dict]] = [(rid, 1, t) for t, rid in zip(tasks, gen_uuids(len(tasks)))]
+        cur.executemany(INSERT_TASK_SQL, task_rows(inserted, task_tail))
+
+        workflows = build_workflows(inserted)
+
+        # Workflows: mostly confirmed to demonstrate strength.
+        # Confirmed workflows must reference confirmed tasks only.
+        for wf in workflows[:8]:
             wf["status"] = "confirmed"
-        elif idx < 11:
+        for wf in workflows[8:11]:
             wf["status"] = "submitted"
-        else:
+        for wf in workflows[11:]:
             wf["status"] = "draft"
 
-    for wf in workflows:
-        wid = str(uuid.uuid4())
-        wv = 1
-        reviewed_at = now if wf["status"] == "confirmed" else None
-        reviewed_by = ACTOR if wf["status"] == "confirmed" else None
-        needs_review_flag = 0 if wf["status"] == "confirmed" else 1
-
-        # If confirming, ensure refs all point at confirmed tasks.
-        if wf["status"] == "confirmed":
-            confirmed_refs = []
-            for trid, tver in wf["refs"]:
-                trow = conn.execute(
-                    "SELECT status FROM tasks WHERE record_id=? AND version=?",
-                    (trid, int(tver)),
-                ).fetchone()
-                if not trow or trow["status"] != "confirmed":
-                    continue
-                confirmed_refs.append((trid, int(tver)))
-            # Fall back to first confirmed tasks if needed
-            if not confirmed_refs:
-                confirmed_refs = [tuple(r) for r in conn.execute(
-                    "SELECT record_id, version FROM tasks WHERE status='confirmed' ORDER BY created_at LIMIT 3"
-                ).fetchall()]
-            wf_refs = confirmed_refs
-        else:
-            wf_refs = wf["refs"]
-
-        # Derive workflow domains from referenced task domains.
-        doms = sorted({
-            str(r["domain"]).strip() for r in conn.execute(
-                "SELECT domain FROM tasks WHERE (record_id, version) IN (%s)" % ",".join(["(?,?)"] * len(wf_refs)),
-                [x for pair in wf_refs for x in pair],
-            ).fetchall() if str(r["domain"]).strip()
-        }) if wf_refs else []
-
-        conn.execute(
-            """
-            INSERT INTO workflows(
-              record_id, version, status,
-              title, objective,
-              domains_json,
-              tags_json, meta_json,
-              created_at, updated_at, created_by, updated_by,
-              reviewed_at, reviewed_by, change_note,
-              needs_review_flag, needs_review_note
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                wid,
-                wv,
-                wf["status"],
-                wf["title"],
-                wf["objective"],
-                j(doms),
-                j(_normalize_tags(wf.get("tags", []) or [])),
-                j(wf.get("meta", {})),
-                now,
-                now,
-                ACTOR,
-                ACTOR,
-                reviewed_at,
-                reviewed_by,
-                SEED_NOTE,
-                needs_review_flag,
-                "Seeded Debian corpus (demo). Confirmed workflows are reviewed examples; unconfirmed require SME review.",
-            ),
-        )
-        for order_index, (trid, tver) in enumerate(wf_refs, start=1):
-            conn.execute(
-                """
-                INSERT INTO workflow_task_refs(workflow_record_id, workflow_version, order_index, task_record_id, task_version)
-                VALUES (?,?,?,?,?)
-                """,
-                (wid, wv, order_index, trid, int(tver)),
+        # First confirmed tasks of this corpus, used when a confirmed workflow has no confirmed refs.
+        default_confirmed = [(rid, ver) for rid, ver, t in inserted if t["status"] == "confirmed"][:3]
+
+        wf_rows: list[tuple] = []
+        ref_rows: list[tuple] = []
+
+        for wf, wid in zip(workflows, gen_uuids(len(workflows))):
+            wv = 1
+
+            # If confirming, ensure refs all point at confirmed tasks.
+            if wf["status"] == "confirmed":
+                confirmed_refs = []
+                for trid, tver in wf["refs"]:
+                    trow = cur.execute(
+                        "SELECT status FROM tasks WHERE record_id=? AND version=?",
+                        (trid, tver),
+                    ).fetchone()
+                    if not trow or trow[0] != "confirmed":
+                        continue
+                    confirmed_refs.append((trid, tver))
+                # Fall back to first confirmed tasks if needed
+                if not confirmed_refs:
+                    confirmed_refs = list(default_confirmed)
+                wf_refs = confirmed_refs
+            else:
+                wf_refs = wf["refs"]
+
+            # Derive workflow domains from referenced task domains.
+            doms = sorted({
+                str(r[0]).strip() for r in cur.execute(
+                    "SELECT domain FROM tasks WHERE (record_id, version) IN (%s)" % ",".join(["(?,?)"] * len(wf_refs)),
+                    [x for pair in wf_refs for x in pair],
+                ).fetchall() if str(r[0]).strip()
+            }) if wf_refs else []
+
+            wf_rows.append(
+                (
+                    wid,
+                    wv,
+                    wf["status"],
+                    wf["title"],
+                    wf["objective"],
+                    j(doms),
+                    j(_normalize_tags(wf.get("tags", []) or [])),
+                    j(wf.get("meta", {})),
+                )
+                + wf_tail[wf["status"]]
             )
+            for order_index, (trid, tver) in enumerate(wf_refs, start=1):
+                ref_rows.append((wid, wv, order_index, trid, tver))
+
+        cur.executemany(INSERT_WORKFLOW_SQL, wf_rows)
+        cur.executemany(INSERT_REF_SQL, ref_rows)
 
-    conn.commit()
+        cur.execute("COMMIT")
+    except BaseException:
+        cur.execute("ROLLBACK")
+        raise
     conn.close()
 
     print(f"Seeded Debian corpus: {len(tasks)} tasks and {len(workflows)} workflows into {DB_PATH}")
@@ -14,87 +14,111 @@ Then start the app:
 
 from __future__ import annotations
 
-import json
 import os
+import re
 import sqlite3
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 
+from seed_common import EMPTY_JSON_LIST, check_foreign_keys, insert_multirow, j
 
+
+# Step-text patterns used to derive optional actions (compiled once at import).
+_RE_BACKTICK = re.compile(r"`([^`]+)`")
+_RE_EDIT_PATH = re.compile(r"\b(edit|open)\s+(/[^\s]+)", re.IGNORECASE)
+# Word tokenizer (same boundaries as \b...\b); one findall splits the step text.
+_RE_WORD = re.compile(r"\w+")
+# Whole-word trigger -> action group; matched against the step's word tokens.
+_KEYWORD_GROUPS = {
+    "restart": "restart",
+    "reload": "restart",
+    "enable": "enable",
+    "disable": "disable",
+    "install": "install",
+    "update": "upgrade",
+    "upgrade": "upgrade",
+}
+
+
+@lru_cache(maxsize=1)
 def utc_now_iso() -> str:
+    """Seed timestamp; computed once so every row in a run shares the same stamp."""
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-def j(v) -> str:
-    return json.dumps(v, ensure_ascii=False)
+@lru_cache(maxsize=1024)
+def _derive_actions(step_text: str) -> tuple[str, ...]:
+    """Aggressively derive optional actions from step text.
 
+    Cached by step text; returns a tuple so cached results cannot be mutated.
+    """
+    s = (step_text or "").strip()
+    if not s:
+        return ()
 
-def main() -> None:
-    # Import app init to guarantee schema is present
-    from app.main import DB_PATH, init_db
+    low = s.lower()
+    actions: list[str] = []
 
-    init_db()
+    cmds = _RE_BACKTICK.findall(s)
+    for c in [x.strip() for x in cmds if x.strip()][:3]:
+        actions.append(c)
 
-    now = utc_now_iso()
-    actor = "seed"
+    m = _RE_EDIT_PATH.search(s)
+    if m:
+        path = m.group(2)
+        actions.append(f"sudo nano {path}  # or your editor of choice")
 
-    # --- Tasks ---
-    # Keep these as DRAFT + needs_review_flag=1: they are structure examples,
-    # not clinically/security authoritative content.
-
-    def _derive_actions(step_text: str) -> list[str]:
-        import re
+    found = {_KEYWORD_GROUPS[w] for w in set(_RE_WORD.findall(low)) if w in _KEYWORD_GROUPS}
+    # Only add generic service/package hints when no such command is present yet.
+    has_systemctl = any("systemctl" in a for a in actions)
+    has_apt = any("apt-get" in a for a in actions)
 
-        s = (step_text or "").strip()
-        if not s:
-            return []
+    if "restart" in found and not has_systemctl:
+        actions.append("sudo systemctl restart <service>")
+        actions.append("sudo systemctl status <service> --no-pager")
+        has_systemctl = True
 
-        low = s.lower()
-        actions: list[str] = []
+    if "enable" in found and not has_systemctl:
+        actions.append("sudo systemctl enable --now <service>")
+        actions.append("systemctl is-enabled <service> && systemctl is-active <service>")
+        has_systemctl = True
 
-        cmds = re.findall(r"`([^`]+)`", s)
-        for c in [x.strip() for x in cmds if x.strip()][:3]:
-            actions.append(c)
+    if "disable" in found and not has_systemctl:
+        actions.append("sudo systemctl disable --now <service>")
+        actions.append("systemctl is-enabled <service> || true")
+        has_systemctl = True
 
-        m = re.search(r"\b(edit|open)\s+(/[^\s]+)", s, flags=re.IGNORECASE)
-        if m:
-            path = m.group(2)
-            actions.append(f"sudo nano {path}  # or your editor of choice")
+    if "install" in found and not has_apt:
+        actions.append("sudo apt-get update")
+        actions.append("sudo apt-get install -y <package>")
+        actions.append("dpkg -l | grep -i <package> || true")
+        has_apt = True
 
-        if re.search(r"\b(restart|reload)\b", low) and not any("systemctl" in a for a in actions):
-            actions.append("sudo systemctl restart <service>")
-            actions.append("sudo systemctl status <service> --no-pager")
+    if "upgrade" in found and not has_apt:
+        actions.append("sudo apt-get update")
+        actions.append("sudo apt-get upgrade -y")
 
-        if re.search(r"\b(enable)\b", low) and not any("systemctl" in a for a in actions):
-            actions.append("sudo systemctl enable --now <service>")
-            actions.append("systemctl is-enabled <service> && systemctl is-active <service>")
+    # Don't add generic evidence-capture boilerplate; completion handles confirmation.
 
-        if re.search(r"\b(disable)\b", low) and not any("systemctl" in a for a in actions):
-            actions.append("sudo systemctl disable --now <service>")
-            actions.append("systemctl is-enabled <service> || true")
+    # De-dupe while preserving order
+    return tuple(dict.fromkeys(actions))
 
-        if re.search(r"\b(install)\b", low) and not any("apt-get" in a for a in actions):
-            actions.append("sudo apt-get update")
-            actions.append("sudo apt-get install -y <package>")
-            actions.append("dpkg -l | grep -i <package> || true")
 
-        if re.search(r"\b(update|upgrade)\b", low) and not any("apt-get" in a for a in actions):
-            actions.append("sudo apt-get update")
-            actions.append("sudo apt-get upgrade -y")
+def main() -> None:
+    # Import app init to guarantee schema is present
+    from app.main import DB_PATH, init_db
 
-        # Don't add generic evidence-capture boilerplate; completion handles confirmation.
+    init_db()
 
-        if not actions:
-            return []
+    now = utc_now_iso()
+    actor = "seed"
+    # Audit/review columns shared by every seeded task and workflow row.
+    common_tail = (now, now, actor, actor, None, None, "seed data", 1, "Seeded example; review for correctness")
 
-        out: list[str] = []
-        seen: set[str] = set()
-        for a in actions:
-            if a in seen:
-                continue
-            seen.add(a)
-            out.append(a)
-        return out
+    # --- Tasks ---
+    # Keep these as DRAFT + needs_review_flag=1: they are structure examples,
+    # not clinically/security authoritative content.
 
     tasks = [
         # IT / Security / Compliance
@@ -225,72 +249,80 @@ def main() -> None:
         },
     ]
 
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA foreign_keys = ON")
-
-    # Insert tasks, track ids for workflow refs
-    inserted: list[tuple[str, int, str]] = []  # (record_id, version, title)
-
-    for t in tasks:
-        # Ensure steps include optional actions
-        steps_out = []
-        for st in t.get("steps", []):
-            if isinstance(st, dict):
-                text = str(st.get("text", ""))
-                completion = str(st.get("completion", ""))
-                actions = st.get("actions")
-                if actions is None:
-                    actions = _derive_actions(text)
-                steps_out.append({"text": text, "completion": completion, "actions": actions})
-            else:
-                steps_out.append({"text": str(st), "completion": "", "actions": _derive_actions(str(st))})
-        t["steps"] = steps_out
-
-        rid = str(uuid.uuid4())
-        ver = 1
-        conn.execute(
-            """
-            INSERT INTO tasks(
-              record_id, version, status,
-              title, outcome, facts_json, concepts_json, procedure_name, steps_json, dependencies_json,
-              irreversible_flag, task_assets_json,
-              created_at, updated_at, created_by, updated_by,
-              reviewed_at, reviewed_by, change_note,
-              needs_review_flag, needs_review_note
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                rid,
-                ver,
-                "draft",
-                t["title"],
-                t["outcome"],
-                j(t["facts"]),
-                j(t["concepts"]),
-                t["procedure_name"],
-                j(t["steps"]),
-                j(t["dependencies"]),
-                int(t["irreversible"]),
-                j([]),
-                now,
-                now,
-                actor,
-                actor,
-                None,
-                None,
-                "seed data",
-                1,
-                "Seeded example; review for correctness",
-            ),
+    # Autocommit at the driver level; the seed runs in one explicit transaction.
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    conn.execute("PRAGMA foreign_keys = OFF")  # refs validated before COMMIT
+    # Write-optimized settings for the one-shot bulk load.
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+    conn.execute("BEGIN IMMEDIATE")
+
+    # Ensure steps include optional actions (seed steps are always dicts); the
+    # normalized lists feed the insert directly and the task dicts stay untouched.
+    steps_by_task = [
+        [
+            {
+                "text": st["text"],
+                "completion": st.get("completion", ""),
+                "actions": st["actions"] if st.get("actions") is not None else list(_derive_actions(st["text"])),
+            }
+            for st in t.get("steps", [])
+        ]
+        for t in tasks
+    ]
+
+    # Assemble insert parameters column by column (one pass per field), then zip
+    # the columns into rows; the literal task definitions above stay readable dicts.
+    n = len(tasks)
+    rids = [uuid.uuid4().hex for _ in range(n)]
+    versions = [1] * n
+    titles = [t["title"] for t in tasks]
+    task_columns = (
+        rids,
+        versions,
+        ["draft"] * n,
+        titles,
+        [t["outcome"] for t in tasks],
+        [j(t["facts"]) for t in tasks],
+        [j(t["concepts"]) for t in tasks],
+        [t["procedure_name"] for t in tasks],
+        [j(steps_out) for steps_out in steps_by_task],
+        [j(t["dependencies"]) for t in tasks],
+        [int(t["irreversible"]) for t in tasks],
+        [EMPTY_JSON_LIST] * n,
+    )
+    task_rows = [head + common_tail for head in zip(*task_columns)]
+
+    # Track ids for workflow refs: (record_id, version, title)
+    inserted: list[tuple[str, int, str]] = list(zip(rids, versions, titles))
+
+    insert_multirow(
+        conn,
+        """
+        INSERT INTO tasks(
+          record_id, version, status,
+          title, outcome, facts_json, concepts_json, procedure_name, steps_json, dependencies_json,
+          irreversible_flag, task_assets_json,
+          created_at, updated_at, created_by, updated_by,
+          reviewed_at, reviewed_by, change_note,
+          needs_review_flag, needs_review_note
         )
-        inserted.append((rid, ver, t["title"]))
+        """,
+        task_rows,
+    )
 
     # --- Workflows ---
     # Workflows can reference draft tasks (authoring rule). We'll create 2 draft workflows.
 
+    # Lower-case each title once; lookups are substring matches in insert order.
+    lowered = [(rid, ver, title.lower()) for rid, ver, title in inserted]
+
     def task_id_by_title(substr: str) -> tuple[str, int]:
-        for rid, ver, title in inserted:
-            if substr.lower() in title.lower():
+        needle = substr.lower()
+        for rid, ver, title in lowered:
+            if needle in title:
                 return rid, ver
         raise RuntimeError(f"seed task not found: {substr}")
 
@@ -313,46 +345,46 @@ def main() -> None:
         },
     ]
 
-    for wf in workflows:
-        wid = str(uuid.uuid4())
-        wv = 1
-        conn.execute(
-            """
-            INSERT INTO workflows(
-              record_id, version, status,
-              title, objective,
-              created_at, updated_at, created_by, updated_by,
-              reviewed_at, reviewed_by, change_note,
-              needs_review_flag, needs_review_note
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
+    wf_ids = [(uuid.uuid4().hex, 1) for _ in workflows]
+    conn.executemany(
+        """
+        INSERT INTO workflows(
+          record_id, version, status,
+          title, objective,
+          created_at, updated_at, created_by, updated_by,
+          reviewed_at, reviewed_by, change_note,
+          needs_review_flag, needs_review_note
+        ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+        """,
+        [
             (
                 wid,
                 wv,
                 "draft",
                 wf["title"],
                 wf["objective"],
-                now,
-                now,
-                actor,
-                actor,
-                None,
-                None,
-                "seed data",
-                1,
-                "Seeded example; review for correctness",
-            ),
-        )
-        for idx, (trid, tver) in enumerate(wf["refs"], start=1):
-            conn.execute(
-                """
-                INSERT INTO workflow_task_refs(workflow_record_id, workflow_version, order_index, task_record_id, task_version)
-                VALUES (?,?,?,?,?)
-                """,
-                (wid, wv, idx, trid, int(tver)),
             )
+            + common_tail
+            for wf, (wid, wv) in zip(workflows, wf_ids)
+        ],
+    )
+
+    ref_rows: list[tuple] = []
+    for wf, (wid, wv) in zip(workflows, wf_ids):
+        for idx, (trid, tver) in enumerate(wf["refs"], start=1):
+            ref_rows.append((wid, wv, idx, trid, int(tver)))
+
+    conn.executemany(
+        """
+        INSERT INTO workflow_task_refs(workflow_record_id, workflow_version, order_index, task_record_id, task_version)
+        VALUES (?,?,?,?,?)
+        """,
+        ref_rows,
+    )
+
+    check_foreign_keys(conn, "workflow_task_refs")
 
-    conn.commit()
+    conn.execute("COMMIT")
     conn.close()
 
     print(f"Seeded {len(tasks)} tasks and {len(workflows)} workflows into {DB_PATH}")
@@ -21,6 +21,8 @@ Run:
 
 Optional:
   python3 seed/seed_large_corpus.py --force
+  python3 seed/seed_large_corpus.py --fast   # defer FK checks and secondary indexes during the load
+  python3 seed/seed_large_corpus.py --skip-derive   # leave step actions empty for SME review
 
 Notes:
 - This is demo data. It is structurally correct, but not authoritative guidance.
@@ -30,96 +32,156 @@ Notes:
 from __future__ import annotations
 
 import argparse
-import json
 import os
+import re
 import sqlite3
 import sys
-import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+
+from seed_common import (
+    EMPTY_JSON_LIST,
+    check_foreign_keys,
+    defer_secondary_indexes,
+    gen_uuids,
+    insert_multirow,
+    j,
+    restore_indexes,
+)
 
 
 SEED_NOTE = "seed_large_corpus_v1"
 ACTOR = "seed"
+# Number of tasks iter_tasks() yields (padded up to this count).
+TASK_COUNT = 50
+
+INSERT_TASK_SQL = """
+INSERT INTO tasks(
+  record_id, version, status,
+  title, outcome, facts_json, concepts_json, procedure_name, steps_json, dependencies_json,
+  irreversible_flag, task_assets_json,
+  tags_json, meta_json,
+  created_at, updated_at, created_by, updated_by,
+  reviewed_at, reviewed_by, change_note,
+  needs_review_flag, needs_review_note
+) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+INSERT_WORKFLOW_SQL = """
+INSERT INTO workflows(
+  record_id, version, status,
+  title, objective,
+  tags_json, meta_json,
+  created_at, updated_at, created_by, updated_by,
+  reviewed_at, reviewed_by, change_note,
+  needs_review_flag, needs_review_note
+) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+INSERT_REF_HEAD = """
+INSERT INTO workflow_task_refs(workflow_record_id, workflow_version, order_index, task_record_id, task_version)"""
+
+# Step-text patterns used to derive optional actions (compiled once at import).
+_RE_BACKTICK = re.compile(r"`([^`]+)`")
+_RE_EDIT_PATH = re.compile(r"\b(edit|open)\s+(/[^\s]+)", re.IGNORECASE)
+# Word tokens (same boundaries as \b...\b) for the fixed keyword triggers.
+_RE_WORD = re.compile(r"\w+")
 
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-def j(v) -> str:
-    return json.dumps(v, ensure_ascii=False)
+# Facts/concepts/deps/tags/meta come from a small fixed vocabulary that the templated
+# tasks repeat verbatim; encode each distinct value once.
+@lru_cache(maxsize=None)
+def _j_strs(items: tuple[str, ...]) -> str:
+    return j(list(items))
+
 
+@lru_cache(maxsize=None)
+def _j_str_map(items: tuple[tuple[str, str], ...]) -> str:
+    return j(dict(items))
 
-def _derive_actions(step_text: str) -> list[str]:
-    """Aggressively derive optional actions from step text."""
-    import re
 
+def j_list(v: list[str]) -> str:
+    """j() for a list of strings, memoized by value."""
+    return _j_strs(tuple(v))
+
+
+def j_map(v: dict[str, str]) -> str:
+    """j() for a str -> str dict, memoized by value (key order preserved)."""
+    return _j_str_map(tuple(v.items()))
+
+
+@lru_cache(maxsize=512)
+def _derive_actions(step_text: str) -> tuple[str, ...]:
+    """Aggressively derive optional actions from step text.
+
+    Cached by step text (templated tasks repeat steps); returns a tuple so cached
+    results cannot be mutated.
+    """
     s = (step_text or "").strip()
     if not s:
-        return []
+        return ()
 
     low = s.lower()
+    tokens = set(_RE_WORD.findall(low))
     actions: list[str] = []
 
-    cmds = re.findall(r"`([^`]+)`", s)
+    cmds = _RE_BACKTICK.findall(s)
     for c in [x.strip() for x in cmds if x.strip()][:3]:
         actions.append(c)
 
-    m = re.search(r"\b(edit|open)\s+(/[^\s]+)", s, flags=re.IGNORECASE)
+    m = _RE_EDIT_PATH.search(s)
     if m:
         path = m.group(2)
         actions.append(f"sudo nano {path}  # or your editor of choice")
 
-    if re.search(r"\b(restart|reload)\b", low) and not any("systemctl" in a for a in actions):
+    if not tokens.isdisjoint(("restart", "reload")) and not any("systemctl" in a for a in actions):
         actions.append("sudo systemctl restart <service>")
         actions.append("sudo systemctl status <service> --no-pager")
 
-    if re.search(r"\b(enable)\b", low) and not any("systemctl" in a for a in actions):
+    if "enable" in tokens and not any("systemctl" in a for a in actions):
         actions.append("sudo systemctl enable --now <service>")
         actions.append("systemctl is-enabled <service> && systemctl is-active <service>")
 
-    if re.search(r"\b(disable)\b", low) and not any("systemctl" in a for a in actions):
+    if "disable" in tokens and not any("systemctl" in a for a in actions):
         actions.append("sudo systemctl disable --now <service>")
         actions.append("systemctl is-enabled <service> || true")
 
-    if re.search(r"\b(install)\b", low) and not any("apt-get" in a for a in actions):
+    if "install" in tokens and not any("apt-get" in a for a in actions):
         actions.append("sudo apt-get update")
         actions.append("sudo apt-get install -y <package>")
         actions.append("dpkg -l | grep -i <package> || true")
 
-    if re.search(r"\b(update|upgrade)\b", low) and not any("apt-get" in a for a in actions):
+    if not tokens.isdisjoint(("update", "upgrade")) and not any("apt-get" in a for a in actions):
         actions.append("sudo apt-get update")
         actions.append("sudo apt-get upgrade -y")
 
     # Don't add generic evidence-capture boilerplate; completion handles confirmation.
 
-    if not actions:
-        return []
-
-    out: list[str] = []
-    seen: set[str] = set()
-    for a in actions:
-        if a in seen:
-            continue
-        seen.add(a)
-        out.append(a)
-    return out
+    # Order-preserving dedupe.
+    return tuple(dict.fromkeys(actions))
 
 
-def step(text: str, completion: str, actions: list[str] | None = None) -> dict[str, object]:
-    return {"text": text, "completion": completion, "actions": actions if actions is not None else _derive_actions(text)}
+def step(text: str, completion: str, actions: list[str] | None = None, *, derive: bool = True) -> dict[str, object]:
+    if actions is None:
+        actions = list(_derive_actions(text)) if derive else []
+    return {"text": text, "completion": completion, "actions": actions}
 
 
-def build_tasks() -> list[dict]:
-    """Return 50 coherent, regulated/high-risk flavored tasks.
+def iter_tasks(derive_actions: bool = True) -> Iterator[dict]:
+    """Yield coherent, regulated/high-risk flavored tasks, one at a time (exactly TASK_COUNT).
 
     Domains: IT/SecOps, Change Mgmt, Clinical ops (structure-only), Aviation/maintenance (structure-only).
+    With derive_actions=False steps get empty actions instead of regex-derived ones.
     """
-
-    tasks: list[dict] = []
+    mk_step = partial(step, derive=derive_actions)
 
     # --- IT / Security / Compliance (most of the corpus) ---
-    tasks += [
+    core = [
         {
             "title": "Register a new privileged access request in the ticketing system",
             "outcome": "A privileged access request is recorded with scope, justification, and approver chain.",
@@ -127,10 +189,10 @@ def build_tasks() -> list[dict]:
             "concepts": ["Access governance: privileges are granted via accountable approvals."],
             "procedure_name": "Create privileged access request",
             "steps": [
-                step("Create a new access request ticket using the approved template.", "Ticket exists and has a unique identifier."),
-                step("Record the requested role/group and the exact systems in scope.", "Ticket includes role/group and system list."),
-                step("Record business justification and requested duration.", "Ticket includes justification and expiry date/time."),
-                step("Assign the ticket to the correct approver group.", "Ticket shows assigned approver group and is in review state."),
+                mk_step("Create a new access request ticket using the approved template.", "Ticket exists and has a unique identifier."),
+                mk_step("Record the requested role/group and the exact systems in scope.", "Ticket includes role/group and system list."),
+                mk_step("Record business justification and requested duration.", "Ticket includes justification and expiry date/time."),
+                mk_step("Assign the ticket to the correct approver group.", "Ticket shows assigned approver group and is in review state."),
             ],
             "deps": ["Access to the ticketing system."],
             "tags": ["security", "governance"],
@@ -144,9 +206,9 @@ def build_tasks() -> list[dict]:
             "concepts": ["Least privilege: approve only the minimum required access."],
             "procedure_name": "Review and decide access request",
             "steps": [
-                step("Review the request scope and justification in the ticket.", "Reviewer notes indicate the request was assessed."),
-                step("Confirm the requested duration complies with policy.", "Ticket includes a compliant expiry or a rejection reason."),
-                step("Approve or reject the request and record rationale.", "Ticket status changes and rationale is recorded."),
+                mk_step("Review the request scope and justification in the ticket.", "Reviewer notes indicate the request was assessed."),
+                mk_step("Confirm the requested duration complies with policy.", "Ticket includes a compliant expiry or a rejection reason."),
+                mk_step("Approve or reject the request and record rationale.", "Ticket status changes and rationale is recorded."),
             ],
             "deps": ["A submitted privileged access request exists."],
             "tags": ["security", "approval"],
@@ -160,10 +222,10 @@ def build_tasks() -> list[dict]:
             "concepts": ["Change control reduces unplanned outages through review and planning."],
             "procedure_name": "Create production change request",
             "steps": [
-                step("Create a change request ticket and classify it by impact.", "Change request exists with impact classification."),
-                step("Document the implementation steps at a high level.", "Ticket contains an implementation plan section."),
-                step("Document a rollback plan with a clear trigger.", "Ticket contains rollback plan and trigger condition."),
-                step("Schedule the change window and notify stakeholders.", "Change window is set and notification is recorded."),
+                mk_step("Create a change request ticket and classify it by impact.", "Change request exists with impact classification."),
+                mk_step("Document the implementation steps at a high level.", "Ticket contains an implementation plan section."),
+                mk_step("Document a rollback plan with a clear trigger.", "Ticket contains rollback plan and trigger condition."),
+                mk_step("Schedule the change window and notify stakeholders.", "Change window is set and notification is recorded."),
             ],
             "deps": ["Access to the ticketing/change system."],
             "tags": ["change-management"],
@@ -177,9 +239,9 @@ def build_tasks() -> list[dict]:
             "concepts": ["Risk assessment: changes should be evaluated for blast radius and reversibility."],
             "procedure_name": "Review production change",
             "steps": [
-                step("Review implementation and rollback plans for completeness.", "Reviewer comment confirms plans are present."),
-                step("Confirm the change window and stakeholder notification are appropriate.", "Ticket shows approved window and notifications."),
-                step("Approve or reject the change with recorded rationale.", "Ticket status updates and rationale is recorded."),
+                mk_step("Review implementation and rollback plans for completeness.", "Reviewer comment confirms plans are present."),
+                mk_step("Confirm the change window and stakeholder notification are appropriate.", "Ticket shows approved window and notifications."),
+                mk_step("Approve or reject the change with recorded rationale.", "Ticket status updates and rationale is recorded."),
             ],
             "deps": ["A draft change request exists."],
             "tags": ["change-management", "approval"],
@@ -193,10 +255,10 @@ def build_tasks() -> list[dict]:
             "concepts": ["Time-bound access reduces long-lived exposure."],
             "procedure_name": "Request firewall rule",
             "steps": [
-                step("Record source, destination, port, and protocol in the request.", "Request includes source/destination/port/protocol."),
-                step("Record business justification and service owner.", "Request includes justification and owner."),
-                step("Set an explicit expiration date/time.", "Request includes expiration timestamp."),
-                step("Attach evidence or references supporting the need.", "Request has at least one attachment or link."),
+                mk_step("Record source, destination, port, and protocol in the request.", "Request includes source/destination/port/protocol."),
+                mk_step("Record business justification and service owner.", "Request includes justification and owner."),
+                mk_step("Set an explicit expiration date/time.", "Request includes expiration timestamp."),
+                mk_step("Attach evidence or references supporting the need.", "Request has at least one attachment or link."),
             ],
             "deps": ["Access to the change/ticket system."],
             "tags": ["security", "network"],
@@ -210,8 +272,8 @@ def build_tasks() -> list[dict]:
             "concepts": ["Control verification: check controls via observable system state."],
             "procedure_name": "Verify disk encryption",
             "steps": [
-                step("Run the approved command or console check for disk encryption status.", "Output shows encryption is enabled."),
-                step("Record the verification result and timestamp in the asset record.", "Asset record includes status and timestamp."),
+                mk_step("Run the approved command or console check for disk encryption status.", "Output shows encryption is enabled."),
+                mk_step("Record the verification result and timestamp in the asset record.", "Asset record includes status and timestamp."),
             ],
             "deps": ["Access to the endpoint management console."],
             "tags": ["security", "endpoint"],
@@ -225,9 +287,9 @@ def build_tasks() -> list[dict]:
             "concepts": ["Incident containment: reduce spread before remediation."],
             "procedure_name": "Quarantine endpoint",
             "steps": [
-                step("Place the endpoint into quarantine using the EDR/management action.", "EDR console shows device in quarantined state."),
-                step("Capture key identifiers (hostname, serial, user) into the incident record.", "Incident record contains device identifiers."),
-                step("Notify the incident channel and assign an owner.", "Incident channel message exists and owner is assigned."),
+                mk_step("Place the endpoint into quarantine using the EDR/management action.", "EDR console shows device in quarantined state."),
+                mk_step("Capture key identifiers (hostname, serial, user) into the incident record.", "Incident record contains device identifiers."),
+                mk_step("Notify the incident channel and assign an owner.", "Incident channel message exists and owner is assigned."),
             ],
             "deps": ["An incident record exists."],
             "tags": ["security", "incident-response"],
@@ -241,9 +303,9 @@ def build_tasks() -> list[dict]:
             "concepts": ["Evidence preservation: collect time-sensitive data early."],
             "procedure_name": "Collect volatile triage",
             "steps": [
-                step("Run the approved triage collection tool on the endpoint.", "Tool completes successfully and outputs an archive."),
-                step("Hash the archive using the approved hash algorithm.", "A hash value is recorded for the archive."),
-                step("Upload the archive and hash to the incident evidence store.", "Evidence store contains the archive and hash."),
+                mk_step("Run the approved triage collection tool on the endpoint.", "Tool completes successfully and outputs an archive."),
+                mk_step("Hash the archive using the approved hash algorithm.", "A hash value is recorded for the archive."),
+                mk_step("Upload the archive and hash to the incident evidence store.", "Evidence store contains the archive and hash."),
             ],
             "deps": ["Endpoint access and approved triage tool."],
             "tags": ["security", "forensics"],
@@ -257,10 +319,10 @@ def build_tasks() -> list[dict]:
             "concepts": ["Credential dependency mapping prevents partial updates."],
             "procedure_name": "Rotate API key",
             "steps": [
-                step("Identify all consumers of the API key.", "A dependency list exists for the API key."),
-                step("Create a new API key in the source system.", "New key is created and has an identifier."),
-                step("Update consumers to use the new key.", "Consumers are updated and deployed."),
-                step("Revoke the old key after validation.", "Old key is revoked and auth logs show successful usage of new key."),
+                mk_step("Identify all consumers of the API key.", "A dependency list exists for the API key."),
+                mk_step("Create a new API key in the source system.", "New key is created and has an identifier."),
+                mk_step("Update consumers to use the new key.", "Consumers are updated and deployed."),
+                mk_step("Revoke the old key after validation.", "Old key is revoked and auth logs show successful usage of new key."),
             ],
             "deps": ["Access to the API key management system."],
             "tags": ["security", "credentials"],
@@ -268,6 +330,8 @@ def build_tasks() -> list[dict]:
             "irreversible": 0,
         },
     ]
+    yield from core
+    count = len(core)
 
     # Expand IT/SecOps set by templating common patterns
     patterns = [
@@ -278,7 +342,8 @@ def build_tasks() -> list[dict]:
         ("Verify", "multi-factor authentication is enforced for admin logins", "MFA enforcement for admin logins is verified and recorded.", "Verify MFA enforcement"),
     ]
     for verb, obj, outcome, pname in patterns:
-        tasks.append(
+        count += 1
+        yield (
             {
                 "title": f"{verb} {obj}",
                 "outcome": outcome,
@@ -286,9 +351,9 @@ def build_tasks() -> list[dict]:
                 "concepts": ["Assurance: verify what is true, not what is assumed."],
                 "procedure_name": pname,
                 "steps": [
-                    step(f"Identify the system records relevant to {obj}.", "Relevant records are located and referenced."),
-                    step(f"Perform the approved check for {obj}.", "Check produces a recorded result."),
-                    step("Record the result and timestamp in the system of record.", "Result is recorded with timestamp."),
+                    mk_step(f"Identify the system records relevant to {obj}.", "Relevant records are located and referenced."),
+                    mk_step(f"Perform the approved check for {obj}.", "Check produces a recorded result."),
+                    mk_step("Record the result and timestamp in the system of record.", "Result is recorded with timestamp."),
                 ],
                 "deps": ["Access to the system of record."],
                 "tags": ["compliance"],
@@ -304,7 +369,8 @@ def build_tasks() -> list[dict]:
         ("Document a critical observation", "A critical observation is recorded and escalated per policy.", "Document critical observation"),
     ]
     for title, outcome, pname in clinical:
-        tasks.append(
+        count += 1
+        yield (
             {
                 "title": title,
                 "outcome": outcome,
@@ -312,9 +378,9 @@ def build_tasks() -> list[dict]:
                 "concepts": ["Standardization reduces omission under time pressure."],
                 "procedure_name": pname,
                 "steps": [
-                    step("Use the approved form/template for the record.", "Record is created using the approved template."),
-                    step("Complete required fields with current observations.", "Required fields are populated and saved."),
-                    step("Escalate to the next role when escalation criteria are met.", "Escalation is documented with timestamp."),
+                    mk_step("Use the approved form/template for the record.", "Record is created using the approved template."),
+                    mk_step("Complete required fields with current observations.", "Required fields are populated and saved."),
+                    mk_step("Escalate to the next role when escalation criteria are met.", "Escalation is documented with timestamp."),
                 ],
                 "deps": ["Access to the clinical record system."],
                 "tags": ["regulated", "high-risk"],
@@ -330,7 +396,8 @@ def build_tasks() -> list[dict]:
         ("Verify tool control before departure", "Tool inventory is verified and recorded.", "Verify tool control"),
     ]
     for title, outcome, pname in aviation:
-        tasks.append(
+        count += 1
+        yield (
             {
                 "title": title,
                 "outcome": outcome,
@@ -338,9 +405,9 @@ def build_tasks() -> list[dict]:
                 "concepts": ["Human factors: checklists reduce omission."],
                 "procedure_name": pname,
                 "steps": [
-                    step("Open the applicable checklist/log entry.", "Checklist/log entry is opened with a unique identifier."),
-                    step("Complete each required item and record findings.", "All required items are marked complete."),
-                    step("Submit the record to the system of record.", "Record is saved with timestamp and author."),
+                    mk_step("Open the applicable checklist/log entry.", "Checklist/log entry is opened with a unique identifier."),
+                    mk_step("Complete each required item and record findings.", "All required items are marked complete."),
+                    mk_step("Submit the record to the system of record.", "Record is saved with timestamp and author."),
                 ],
                 "deps": ["Access to the technical log/checklist."],
                 "tags": ["regulated", "safety"],
@@ -349,10 +416,11 @@ def build_tasks() -> list[dict]:
             }
         )
 
-    # Ensure exactly 50 tasks by adding simple compliance tasks if needed
-    while len(tasks) < 50:
-        idx = len(tasks) + 1
-        tasks.append(
+    # Ensure exactly TASK_COUNT tasks by adding simple compliance tasks if needed
+    while count < TASK_COUNT:
+        count += 1
+        idx = count
+        yield (
             {
                 "title": f"Perform quarterly access recertification check #{idx}",
                 "outcome": "Access recertification evidence is recorded for the scoped system.",
@@ -360,9 +428,9 @@ def build_tasks() -> list[dict]:
                 "concepts": ["Periodic review reduces access drift."],
                 "procedure_name": "Perform access recertification",
                 "steps": [
-                    step("Export the current access list for the system.", "An export file is produced and stored."),
-                    step("Obtain owner attestation for the access list.", "Owner attestation is recorded."),
-                    step("File the evidence in the audit repository.", "Evidence is stored with date and scope."),
+                    mk_step("Export the current access list for the system.", "An export file is produced and stored."),
+                    mk_step("Obtain owner attestation for the access list.", "Owner attestation is recorded."),
+                    mk_step("File the evidence in the audit repository.", "Evidence is stored with date and scope."),
                 ],
                 "deps": ["System owner is identified."],
                 "tags": ["compliance"],
@@ -371,27 +439,52 @@ def build_tasks() -> list[dict]:
             }
         )
 
-    return tasks[:50]
 
+def task_rows(
+    tasks: Iterator[dict], rids: list[str], tail: tuple, index: list[tuple[str, int, list[str]]]
+) -> Iterator[tuple]:
+    """Yield INSERT_TASK_SQL parameters for the streamed tasks, assigning statuses on the way.
 
-def build_workflows(task_ids: list[tuple[str, int, dict]]) -> list[dict]:
+    Each task's (record_id, version, tags) is appended to index so workflows can
+    reference it. rids must match the task count (strict zip fails loudly otherwise).
+    """
+    for idx, (t, rid) in enumerate(zip(tasks, rids, strict=True)):
+        ver = 1
+        index.append((rid, ver, t.get("tags", [])))
+        yield (
+            rid,
+            ver,
+            "draft" if idx < 30 else "submitted",
+            t["title"],
+            t["outcome"],
+            j_list(t.get("facts", [])),
+            j_list(t.get("concepts", [])),
+            t["procedure_name"],
+            j(t.get("steps", [])),
+            j_list(t.get("deps", [])),
+            int(t.get("irreversible", 0)),
+            EMPTY_JSON_LIST,
+            j_list(t.get("tags", [])),
+            j_map(t.get("meta", {})),
+        ) + tail
+
+
+def build_workflows(task_ids: list[tuple[str, int, list[str]]]) -> list[dict]:
     """Create 10 workflows referencing the seeded task ids.
 
-    task_ids entries include (record_id, version, task_dict).
+    task_ids entries are (record_id, version, tags).
     """
 
-    # helper: pick tasks by tag
-    def pick(tag: str, n: int) -> list[tuple[str, int]]:
-        out: list[tuple[str, int]] = []
-        for rid, ver, t in task_ids:
-            if tag in t.get("tags", []):
-                out.append((rid, ver))
-        return out[:n]
+    # tag -> task refs in seed order, built in one pass over the tasks
+    by_tag: dict[str, list[tuple[str, int]]] = {}
+    for rid, ver, tags in task_ids:
+        for tag in dict.fromkeys(tags):  # a repeated tag still refs the task once
+            by_tag.setdefault(tag, []).append((rid, ver))
 
-    security_core = pick("security", 6)
-    compliance_core = pick("compliance", 6)
-    change_core = pick("change-management", 4)
-    incident_core = pick("incident-response", 3)
+    security_core = by_tag.get("security", [])[:6]
+    compliance_core = by_tag.get("compliance", [])[:6]
+    change_core = by_tag.get("change-management", [])[:4]
+    incident_core = by_tag.get("incident-response", [])[:3]
 
     workflows = [
         {
@@ -465,16 +558,35 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--force", action="store_true", help="Allow reseeding even if seed marker exists")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip per-row FK checks and secondary index upkeep during the load (validated before commit)",
+    )
+    parser.add_argument(
+        "--skip-derive",
+        action="store_true",
+        help="Don't derive step actions from step text; seeded steps get empty actions",
+    )
     args = parser.parse_args()
 
     init_db()
 
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA foreign_keys = ON")
+    # Autocommit at the driver level; the inserts run in one explicit transaction.
+    conn = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
     conn.row_factory = sqlite3.Row
+    # Reuse one cursor rather than the throwaway cursor conn.execute() creates per call.
+    cur = conn.cursor()
+    # --fast validates refs before COMMIT instead of per row.
+    cur.execute(f"PRAGMA foreign_keys = {'OFF' if args.fast else 'ON'}")
+    # Write-optimized settings for the bulk load (connection-scoped; WAL matches the app).
+    cur.execute("PRAGMA journal_mode = WAL")
+    cur.execute("PRAGMA synchronous = NORMAL")
+    cur.execute("PRAGMA temp_store = MEMORY")
+    cur.execute("PRAGMA cache_size = -65536")  # 64 MiB
 
     # idempotency check
-    existing = conn.execute(
+    existing = cur.execute(
         "SELECT 1 FROM tasks WHERE change_note=? LIMIT 1",
         (SEED_NOTE,),
     ).fetchone()
@@ -483,111 +595,63 @@ def main() -> None:
             f"Refusing to seed: corpus marker '{SEED_NOTE}' already present. Run with --force to reseed."
         )
 
+    # Every seeded row shares one created_at/updated_at value, computed once here.
     now = utc_now_iso()
+    # Audit/review columns shared by every seeded task and workflow row.
+    common_tail = (now, now, ACTOR, ACTOR, None, None, SEED_NOTE, 1, "Seeded corpus (structure demo); requires SME review")
 
-    tasks = build_tasks()
+    # All rows are written in one transaction (one commit) instead of one per statement.
+    cur.execute("BEGIN IMMEDIATE")
 
-    # Assign statuses
-    for idx, t in enumerate(tasks):
-        t["status"] = "draft" if idx < 30 else "submitted"
+    # --fast: rebuild the bulk-loaded tables' secondary indexes once, after the load.
+    deferred_indexes: list[tuple[str, str]] = []
+    if args.fast:
+        deferred_indexes = defer_secondary_indexes(cur, ("tasks", "workflows", "workflow_task_refs"))
 
-    # Insert tasks
-    inserted_tasks: list[tuple[str, int, dict]] = []
-    for t in tasks:
-        rid = str(uuid.uuid4())
-        ver = 1
-        conn.execute(
-            """
-            INSERT INTO tasks(
-              record_id, version, status,
-              title, outcome, facts_json, concepts_json, procedure_name, steps_json, dependencies_json,
-              irreversible_flag, task_assets_json,
-              tags_json, meta_json,
-              created_at, updated_at, created_by, updated_by,
-              reviewed_at, reviewed_by, change_note,
-              needs_review_flag, needs_review_note
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                rid,
-                ver,
-                t["status"],
-                t["title"],
-                t["outcome"],
-                j(t.get("facts", [])),
-                j(t.get("concepts", [])),
-                t["procedure_name"],
-                j(t.get("steps", [])),
-                j(t.get("deps", [])),
-                int(t.get("irreversible", 0)),
-                j([]),
-                j(t.get("tags", [])),
-                j(t.get("meta", {})),
-                now,
-                now,
-                ACTOR,
-                ACTOR,
-                None,
-                None,
-                SEED_NOTE,
-                1,
-                "Seeded corpus (structure demo); requires SME review",
-            ),
-        )
-        inserted_tasks.append((rid, ver, t))
+    # Stream task definitions straight into executemany; only the (rid, ver, tags)
+    # index that build_workflows needs is kept.
+    task_index: list[tuple[str, int, list[str]]] = []
+    cur.executemany(
+        INSERT_TASK_SQL,
+        task_rows(iter_tasks(derive_actions=not args.skip_derive), gen_uuids(TASK_COUNT), common_tail, task_index),
+    )
 
     # Build workflows
-    workflows = build_workflows(inserted_tasks)
+    workflows = build_workflows(task_index)
 
     for idx, wf in enumerate(workflows):
         wf["status"] = "draft" if idx < 6 else "submitted"
 
-    for wf in workflows:
-        wid = str(uuid.uuid4())
+    wf_rows: list[tuple] = []
+    ref_rows: list[tuple] = []
+    for wf, wid in zip(workflows, gen_uuids(len(workflows))):
         wv = 1
-        conn.execute(
-            """
-            INSERT INTO workflows(
-              record_id, version, status,
-              title, objective,
-              tags_json, meta_json,
-              created_at, updated_at, created_by, updated_by,
-              reviewed_at, reviewed_by, change_note,
-              needs_review_flag, needs_review_note
-            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
+        wf_rows.append(
             (
                 wid,
                 wv,
                 wf["status"],
                 wf["title"],
                 wf["objective"],
-                j(wf.get("tags", [])),
-                j(wf.get("meta", {})),
-                now,
-                now,
-                ACTOR,
-                ACTOR,
-                None,
-                None,
-                SEED_NOTE,
-                1,
-                "Seeded corpus (structure demo); requires SME review",
-            ),
+                j_list(wf.get("tags", [])),
+                j_map(wf.get("meta", {})),
+            )
+            + common_tail
         )
         for order_index, (trid, tver) in enumerate(wf["refs"], start=1):
-            conn.execute(
-                """
-                INSERT INTO workflow_task_refs(workflow_record_id, workflow_version, order_index, task_record_id, task_version)
-                VALUES (?,?,?,?,?)
-                """,
-                (wid, wv, order_index, trid, int(tver)),
-            )
+            ref_rows.append((wid, wv, order_index, trid, int(tver)))
+
+    cur.executemany(INSERT_WORKFLOW_SQL, wf_rows)
+    insert_multirow(cur, INSERT_REF_HEAD, ref_rows)
+
+    if args.fast:
+        restore_indexes(cur, deferred_indexes)
+        check_foreign_keys(cur, "workflow_task_refs")
 
-    conn.commit()
+    cur.execute("COMMIT")
     conn.close()
 
-    print(f"Seeded: {len(tasks)} tasks and {len(workflows)} workflows into {DB_PATH}")
+    print(f"Seeded: {len(task_index)} tasks and {len(workflows)} workflows into {DB_PATH}")
 
 
 if __name__ == "__main__":